@@ -5,46 +5,362 @@ This allows the web backend to run on a separate server.
 """
 
 import os
+import gzip
 import json
 import re
+import stat
+import tempfile
 import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 import logging
+from email.utils import parsedate_to_datetime
 from datetime import datetime, timezone
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 from configparser import ConfigParser
 try:
-    from processor import generate_pdf_report
+    import orjson
 except ImportError:
-    generate_pdf_report = None
+    orjson = None
 
 # Will be set by start_api_server()
-_config = None
-_base_dir = None
+_FOLDER_MAP = {}
+_STATUS_PATH = None
+_HISTORY_PATH = None
+_LOG_PATH = None
+_OUTPUT_PATH = None
+
+# PDF reports are generated in the background; jobs are keyed by job id
+_report_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='report')
+_report_jobs = {}
+# Finished jobs are evicted, oldest first, beyond this many
+_MAX_REPORT_JOBS = 50
+# New report requests reuse a pending job once this many are queued or running
+_MAX_PENDING_REPORTS = 2
+_report_jobs_lock = threading.Lock()
+# Imported from processor on the first report request
+_generate_pdf_report = None
+
+# Matches one log entry; the message group also absorbs any following lines
+# that don't start a new entry (tracebacks and other multi-line messages).
+_LOG_PATTERN = re.compile(
+    rb"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - (INFO|WARNING|ERROR) - "
+    rb"([^\n]*(?:\n(?!\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} - (?:INFO|WARNING|ERROR) - )[^\n]*)*)",
+    re.MULTILINE,
+)
+
+
+def _dumps(data):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _loads(raw):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# os.umask can only be read by setting it, so read it once at import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Responses smaller than this are sent uncompressed
+_GZIP_MIN_SIZE = 1024
+
+# Constant response bodies, serialized once
+_HEALTH_BODY = b'{"status":"ok"}'
+_ROOT_BODY = _dumps({"message": "Ingest Engine API", "endpoints": ["/api/status", "/api/history", "/api/logs", "/api/folders/{name}", "/api/health", "/api/report", "/api/report/{id}"]})
+
+# File contents keyed by path, as ((mtime_ns, size), raw bytes, gzipped bytes or None)
+_file_cache = {}
+_file_cache_lock = threading.Lock()
+
+
+def _read_json_file(path, compress=False):
+    """
+    Return the raw bytes of a JSON file, re-reading it only when it changes on disk.
+
+    The contents are validated before being cached so a half-written file is
+    reported as an error rather than served to clients. Returns (raw, gzipped);
+    gzipped is only set when compress is requested and the file is large enough,
+    and is cached so each version of the file is compressed once.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    with _file_cache_lock:
+        cached = _file_cache.get(path)
+
+    if cached and cached[0] == key:
+        _, raw, gzipped = cached
+    else:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            key = (st.st_mtime_ns, st.st_size)
+            raw = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+        _loads(raw)
+        gzipped = None
+        cached = None
+
+    if compress and gzipped is None and len(raw) > _GZIP_MIN_SIZE:
+        gzipped = gzip.compress(raw, compresslevel=1)
+        cached = None
+    if cached is None:
+        with _file_cache_lock:
+            _file_cache[path] = (key, raw, gzipped)
+    return raw, gzipped if compress else None
+
+
+def _stat_etag(st):
+    """Build an ETag for a file from its modification time and size."""
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _gzip_etag(etag):
+    """Return the ETag for the gzip-encoded variant of a response."""
+    return etag[:-1] + '-gz"'
+
+
+def _tail_bytes(path, n=100, block_size=8192):
+    """Return the last n lines of a file as one bytes buffer, reading backwards from the end in blocks."""
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        blocks = []
+        newlines = 0
+        # n complete lines need n + 1 newlines, counting the one before the first line
+        while pos > 0 and newlines <= n:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size)
+            newlines += block.count(b'\n')
+            blocks.append(block)
+    data = b''.join(reversed(blocks))
+
+    # Walk newlines back from the end to find where the last n lines start
+    end = len(data) - 1 if data.endswith(b'\n') else len(data)
+    for _ in range(n):
+        end = data.rfind(b'\n', 0, end)
+        if end < 0:
+            return data
+    return data[end + 1:]
+
+
+def _log_message(raw):
+    """Decode a log message, stripping each line and dropping blank continuation lines."""
+    if b'\n' not in raw:
+        return raw.strip().decode('utf-8', errors='replace')
+    first, *rest = raw.split(b'\n')
+    lines = [first.strip()] + [line.strip() for line in rest if line.strip()]
+    return b'\n'.join(lines).decode('utf-8', errors='replace')
+
+
+# Folder listings keyed by folder name, as (directory mtime_ns, JSON bytes, ETag)
+_folder_cache = {}
+_folder_cache_lock = threading.Lock()
+
+
+def _list_folder(folder_name, path):
+    """
+    Return the JSON listing of a folder and its ETag.
+
+    Listings are cached until the directory's mtime changes, which happens when
+    entries are added, removed or renamed. Size and mtime changes of files
+    already in the folder are not picked up until then.
+    """
+    dir_mtime = os.stat(path).st_mtime_ns
+    with _folder_cache_lock:
+        cached = _folder_cache.get(folder_name)
+    if cached and cached[0] == dir_mtime:
+        return cached[1], cached[2]
+
+    files_data = []
+    # XOR of per-file hashes, so the ETag doesn't depend on listing order
+    listing_hash = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_file():
+                continue
+            st = entry.stat()
+            listing_hash ^= hash((entry.name, st.st_size, st.st_mtime_ns))
+            files_data.append({
+                "name": entry.name,
+                "size": st.st_size,
+                "modified_time": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat()
+            })
+    body = _dumps({"folder": folder_name, "files": files_data})
+    etag = f'"{listing_hash & 0xFFFFFFFFFFFFFFFF:x}"'
+    with _folder_cache_lock:
+        _folder_cache[folder_name] = (dir_mtime, body, etag)
+    return body, etag
+
 
 class IngestAPIHandler(BaseHTTPRequestHandler):
     """HTTP request handler for the Ingest Engine API."""
 
+    # HTTP/1.1 keeps connections open between polls unless the client asks to
+    # close; idle ones are dropped after the timeout
+    protocol_version = 'HTTP/1.1'
+    timeout = 30
+    # Set once the status line of the current response has been written
+    _response_started = False
+
     def log_message(self, format, *args):
         """Override to use our logging instead of printing to stderr."""
         logging.debug(f"API: {args[0]}")
 
+    def handle_one_request(self):
+        """Handle one request, resetting per-response state first."""
+        self._response_started = False
+        super().handle_one_request()
+
+    def parse_request(self):
+        """
+        Parse the request line and headers, then discard any request body.
+
+        No endpoint reads a body, but on a kept-alive connection unread bytes
+        would be parsed as the start of the next request.
+        """
+        if not super().parse_request():
+            return False
+        if 'Transfer-Encoding' in self.headers:
+            self.close_connection = True
+            return True
+        try:
+            remaining = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            remaining = -1
+        if remaining < 0:
+            self.close_connection = True
+            return True
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, 65536))
+            if not chunk:
+                self.close_connection = True
+                break
+            remaining -= len(chunk)
+        return True
+
+    def send_response(self, code, message=None):
+        """Send the status line, recording that this request has been answered."""
+        self._response_started = True
+        super().send_response(code, message)
+
     def _send_json_response(self, data, status=200):
         """Send a JSON response."""
+        self._send_raw_json(_dumps(data), status)
+
+    def _send_raw_json(self, raw, status=200, etag=None, last_modified=None, gzipped=None):
+        """
+        Send bytes that are already encoded JSON.
+
+        Large bodies are gzipped when the client accepts it; pass gzipped to
+        reuse an already compressed copy of raw.
+        """
+        if self._response_started:
+            # An error after the headers went out; a second response would
+            # corrupt the stream, so drop the connection instead
+            self.close_connection = True
+            return
+        body = raw
+        if len(raw) > _GZIP_MIN_SIZE and self._accepts_gzip():
+            body = gzipped if gzipped is not None else gzip.compress(raw, compresslevel=1)
+            if etag:
+                etag = _gzip_etag(etag)
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if body is not raw:
+            self.send_header('Content-Encoding', 'gzip')
+        if len(raw) > _GZIP_MIN_SIZE:
+            self.send_header('Vary', 'Accept-Encoding')
+        if etag:
+            self._send_validator_headers(etag, last_modified)
+        self._send_cors_headers()
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _accepts_gzip(self):
+        """Check whether the client accepts gzip-encoded responses, honouring q=0."""
+        for coding in self.headers.get('Accept-Encoding', '').split(','):
+            name, *params = [part.strip() for part in coding.split(';')]
+            if name.lower() not in ('gzip', 'x-gzip'):
+                continue
+            for param in params:
+                key, _, value = param.partition('=')
+                if key.strip().lower() == 'q':
+                    try:
+                        return float(value) > 0
+                    except ValueError:
+                        return False
+            return True
+        return False
+
+    def _send_not_modified(self, etag, last_modified=None):
+        """Send a 304 telling the client its cached copy is still current."""
+        self.send_response(304)
+        self.send_header('Vary', 'Accept-Encoding')
+        self._send_validator_headers(etag, last_modified)
+        self._send_cors_headers()
+        self.end_headers()
+
+    def _send_validator_headers(self, etag, last_modified=None):
+        """Send ETag/Last-Modified, asking clients to revalidate on every poll."""
+        self.send_header('ETag', etag)
+        # Last-Modified has one-second resolution, so it is only a safe validator
+        # once the second the file was modified in has passed
+        if last_modified is not None and time.time() - last_modified >= 1:
+            self.send_header('Last-Modified', self.date_time_string(last_modified))
+        self.send_header('Cache-Control', 'no-cache')
+
+    def _send_cors_headers(self):
+        """Send the CORS headers shared by every response."""
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, DELETE, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
-        self.wfile.write(json.dumps(data).encode('utf-8'))
+
+    def _not_modified_etag(self, etag, last_modified=None):
+        """
+        Check the request's conditional headers against the current ETag/mtime.
+
+        Returns the ETag to send with a 304 when the client's copy is current,
+        or None. The gzip variant of etag also matches if the client still
+        accepts gzip, since it is the same content.
+        """
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            # If-Modified-Since is ignored when If-None-Match is present (RFC 9110)
+            tags = [t.strip().removeprefix('W/') for t in if_none_match.split(',')]
+            if etag in tags or '*' in tags:
+                return etag
+            if _gzip_etag(etag) in tags and self._accepts_gzip():
+                return _gzip_etag(etag)
+            return None
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if not if_modified_since or last_modified is None:
+            return None
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return etag if int(last_modified) <= since.timestamp() else None
 
     def do_OPTIONS(self):
         """Handle CORS preflight requests."""
         self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
+        self._send_cors_headers()
         self.end_headers()
 
     def do_GET(self):
@@ -53,23 +369,15 @@ class IngestAPIHandler(BaseHTTPRequestHandler):
         path = parsed.path
 
         try:
-            if path == '/api/status':
-                self._handle_status()
-            elif path == '/api/history':
-                self._handle_history()
-            elif path == '/api/logs':
-                self._handle_logs()
-            elif path.startswith('/api/folders/'):
-                folder_name = path.split('/api/folders/')[-1]
-                self._handle_folder(folder_name)
-            elif path == '/api/health':
-                self._send_json_response({"status": "ok"})
-            elif path == '/api/report':
-                self._handle_report()
-            elif path == '/':
-                self._send_json_response({"message": "Ingest Engine API", "endpoints": ["/api/status", "/api/history", "/api/logs", "/api/folders/{name}", "/api/health", "/api/report"]})
-            else:
-                self._send_json_response({"error": "Not found"}, 404)
+            handler = self._ROUTES_GET.get(path)
+            if handler:
+                handler(self)
+                return
+            for prefix, handler in self._PREFIX_ROUTES_GET:
+                if path.startswith(prefix):
+                    handler(self, path[len(prefix):])
+                    return
+            self._send_json_response({"error": "Not found"}, 404)
         except Exception as e:
             logging.error(f"API error handling {path}: {e}")
             self._send_json_response({"error": str(e)}, 500)
@@ -80,22 +388,45 @@ class IngestAPIHandler(BaseHTTPRequestHandler):
         path = parsed.path
 
         try:
-            if path == '/api/history':
-                self._handle_clear_history()
-            elif path == '/api/logs':
-                self._handle_clear_logs()
-            else:
-                self._send_json_response({"error": "Not found"}, 404)
+            handler = self._ROUTES_DELETE.get(path)
+            if handler:
+                handler(self)
+                return
+            self._send_json_response({"error": "Not found"}, 404)
         except Exception as e:
             logging.error(f"API error handling DELETE {path}: {e}")
             self._send_json_response({"error": str(e)}, 500)
 
+    def _handle_root(self):
+        """List the available endpoints."""
+        self._send_raw_json(_ROOT_BODY)
+
+    def _handle_health(self):
+        """Report that the server is up."""
+        self._send_raw_json(_HEALTH_BODY)
+
     def _handle_clear_history(self):
         """Clear all processing history."""
-        history_path = os.path.join(_base_dir, _config['Paths']['history_file'])
+        history_path = _HISTORY_PATH
         try:
-            with open(history_path, 'w') as f:
-                json.dump([], f)
+            # Swap the file in whole so readers never see it half-written; the
+            # temp file is unique so concurrent clears don't race on it
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(history_path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(b'[]')
+                try:
+                    mode = stat.S_IMODE(os.stat(history_path).st_mode)
+                except FileNotFoundError:
+                    mode = 0o666 & ~_UMASK
+                os.chmod(tmp_path, mode)
+                os.replace(tmp_path, history_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
             logging.info("History cleared via API")
             self._send_json_response({"cleared": True, "message": "History cleared"})
         except Exception as e:
@@ -103,11 +434,12 @@ class IngestAPIHandler(BaseHTTPRequestHandler):
 
     def _handle_clear_logs(self):
         """Clear the log file."""
-        log_dir = os.path.join(_base_dir, _config['Paths']['logs'])
-        log_path = os.path.join(log_dir, 'ingest_engine.log')
+        log_path = _LOG_PATH
         try:
-            with open(log_path, 'w') as f:
-                f.truncate(0)
+            try:
+                os.truncate(log_path, 0)
+            except FileNotFoundError:
+                open(log_path, 'wb').close()
             logging.info("Logs cleared via API")
             self._send_json_response({"cleared": True, "message": "Logs cleared"})
         except Exception as e:
@@ -115,112 +447,159 @@ class IngestAPIHandler(BaseHTTPRequestHandler):
 
     def _handle_status(self):
         """Return current processing status."""
-        status_path = os.path.join(_base_dir, _config['Paths']['status_file'])
+        status_path = _STATUS_PATH
         if not os.path.exists(status_path):
             self._send_json_response({"status": "idle", "file": "None", "progress": 0, "stage": "Idle"})
             return
 
         try:
-            with open(status_path, 'r') as f:
-                data = json.load(f)
-            self._send_json_response(data)
+            # No Last-Modified here: status is rewritten several times a second
+            # during transcodes, finer than its one-second resolution
+            st = os.stat(status_path)
+            etag = _stat_etag(st)
+            not_modified = self._not_modified_etag(etag)
+            if not_modified:
+                self._send_not_modified(not_modified)
+                return
+            raw, gzipped = _read_json_file(status_path, compress=self._accepts_gzip())
+            self._send_raw_json(raw, etag=etag, gzipped=gzipped)
         except (json.JSONDecodeError, IOError) as e:
             self._send_json_response({"error": f"Error reading status: {e}"}, 500)
 
     def _handle_history(self):
         """Return processing history."""
-        history_path = os.path.join(_base_dir, _config['Paths']['history_file'])
+        history_path = _HISTORY_PATH
         if not os.path.exists(history_path):
             self._send_json_response([])
             return
 
         try:
-            with open(history_path, 'r') as f:
-                data = json.load(f)
-            self._send_json_response(data)
+            st = os.stat(history_path)
+            etag = _stat_etag(st)
+            not_modified = self._not_modified_etag(etag, st.st_mtime)
+            if not_modified:
+                self._send_not_modified(not_modified, st.st_mtime)
+                return
+            # Sent from the validated in-memory copy rather than with sendfile:
+            # processor rewrites history.json in place, so bytes read from disk
+            # at send time may not be the ones that were validated
+            raw, gzipped = _read_json_file(history_path, compress=self._accepts_gzip())
+            self._send_raw_json(raw, etag=etag, last_modified=st.st_mtime, gzipped=gzipped)
         except (json.JSONDecodeError, IOError) as e:
             self._send_json_response({"error": f"Error reading history: {e}"}, 500)
 
     def _handle_logs(self):
         """Return recent log entries."""
-        log_dir = os.path.join(_base_dir, _config['Paths']['logs'])
-        log_path = os.path.join(log_dir, 'ingest_engine.log')
+        log_path = _LOG_PATH
 
         if not os.path.exists(log_path):
             self._send_json_response([])
             return
 
-        logs = []
-        log_pattern = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - (INFO|WARNING|ERROR) - (.*)$")
-
         try:
-            with open(log_path, 'r') as f:
-                all_lines = f.readlines()
-                for line in all_lines[-100:]:
-                    match = log_pattern.match(line)
-                    if match:
-                        logs.append({
-                            "timestamp": match.group(1),
-                            "level": match.group(2),
-                            "message": match.group(3).strip()
-                        })
-                    elif logs and line.strip():
-                        logs[-1]["message"] += "\n" + line.strip()
+            logs = [
+                {
+                    "timestamp": match.group(1).decode('ascii'),
+                    "level": match.group(2).decode('ascii'),
+                    "message": _log_message(match.group(3))
+                }
+                for match in _LOG_PATTERN.finditer(_tail_bytes(log_path, 100))
+            ]
             self._send_json_response(logs)
         except IOError as e:
             self._send_json_response({"error": f"Error reading logs: {e}"}, 500)
 
     def _handle_folder(self, folder_name):
         """Return contents of a specific folder."""
-        folder_map = {
-            "watch": _config.get('Paths', 'watch', fallback=None),
-            "processing": _config.get('Paths', 'processing', fallback=None),
-            "processed": _config.get('Paths', 'processed', fallback=None),
-            "output": _config.get('Paths', 'output', fallback=None),
-            "error": _config.get('Paths', 'error', fallback=None),
-        }
-
-        if folder_name not in folder_map or not folder_map[folder_name]:
+        path = _FOLDER_MAP.get(folder_name)
+        if not path:
             self._send_json_response({"error": f"Invalid folder: {folder_name}"}, 400)
             return
 
-        path = os.path.expanduser(folder_map[folder_name])
-
         if not os.path.isdir(path):
             self._send_json_response({"error": f"Path not found: {path}"}, 404)
             return
 
         try:
-            files_data = []
-            for f_name in os.listdir(path):
-                full_path = os.path.join(path, f_name)
-                if os.path.isfile(full_path) and not f_name.startswith('.'):
-                    stat = os.stat(full_path)
-                    files_data.append({
-                        "name": f_name,
-                        "size": stat.st_size,
-                        "modified_time": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat()
-                    })
-            self._send_json_response({"folder": folder_name, "files": files_data})
+            body, etag = _list_folder(folder_name, path)
+            not_modified = self._not_modified_etag(etag)
+            if not_modified:
+                self._send_not_modified(not_modified)
+                return
+            self._send_raw_json(body, etag=etag)
         except Exception as e:
             self._send_json_response({"error": f"Error listing folder: {e}"}, 500)
 
     def _handle_report(self):
-        """Generate and return path to PDF report."""
-        if not generate_pdf_report:
-            self._send_json_response({"error": "PDF report generation not available"}, 501)
+        """Start generating a PDF report and return the job id to poll."""
+        global _generate_pdf_report
+        if _generate_pdf_report is None:
+            try:
+                from processor import generate_pdf_report
+            except ImportError:
+                self._send_json_response({"error": "PDF report generation not available"}, 501)
+                return
+            _generate_pdf_report = generate_pdf_report
+        history_path = _HISTORY_PATH
+        output_folder = _OUTPUT_PATH
+
+        with _report_jobs_lock:
+            pending = [jid for jid, fut in _report_jobs.items() if not fut.done()]
+            if len(pending) >= _MAX_PENDING_REPORTS:
+                job_id = pending[-1]
+            else:
+                job_id = uuid.uuid4().hex
+                _report_jobs[job_id] = _report_executor.submit(_generate_pdf_report, history_path, output_folder)
+            if len(_report_jobs) > _MAX_REPORT_JOBS:
+                finished = [jid for jid, fut in _report_jobs.items() if fut.done()]
+                for jid in finished[:len(_report_jobs) - _MAX_REPORT_JOBS]:
+                    del _report_jobs[jid]
+        self._send_json_response({"job_id": job_id, "status": "pending"}, 202)
+
+    def _handle_report_status(self, job_id):
+        """Return the state of a report job, and the PDF path once it is done."""
+        with _report_jobs_lock:
+            future = _report_jobs.get(job_id)
+        if future is None:
+            self._send_json_response({"error": f"Unknown report job: {job_id}"}, 404)
+            return
+        if not future.done():
+            self._send_json_response({"job_id": job_id, "status": "pending"})
             return
-        history_path = os.path.join(_base_dir, _config['Paths']['history_file'])
-        output_folder = os.path.expanduser(_config['Paths']['output'])
 
         try:
-            pdf_path = generate_pdf_report(history_path, output_folder)
+            pdf_path = future.result()
             if pdf_path:
-                self._send_json_response({"success": True, "path": pdf_path})
+                self._send_json_response({"job_id": job_id, "status": "done", "success": True, "path": pdf_path})
             else:
-                self._send_json_response({"success": False, "error": "No history to report"}, 400)
+                self._send_json_response({"job_id": job_id, "status": "done", "success": False, "error": "No history to report"}, 400)
         except Exception as e:
-            self._send_json_response({"error": f"Error generating report: {e}"}, 500)
+            self._send_json_response({"job_id": job_id, "status": "failed", "error": f"Error generating report: {e}"}, 500)
+
+    # Exact paths map to handlers; prefix routes pass the rest of the path as an argument
+    _ROUTES_GET = {
+        '/': _handle_root,
+        '/api/status': _handle_status,
+        '/api/history': _handle_history,
+        '/api/logs': _handle_logs,
+        '/api/health': _handle_health,
+        '/api/report': _handle_report,
+    }
+    _PREFIX_ROUTES_GET = (
+        ('/api/folders/', _handle_folder),
+        ('/api/report/', _handle_report_status),
+    )
+    _ROUTES_DELETE = {
+        '/api/history': _handle_clear_history,
+        '/api/logs': _handle_clear_logs,
+    }
+
+
+class IngestAPIServer(ThreadingHTTPServer):
+    """HTTP server that handles each request on its own thread."""
+
+    daemon_threads = True
+    request_queue_size = 64
 
 
 def start_api_server(config: ConfigParser, base_dir: str, host: str = '0.0.0.0', port: int = 8080):
@@ -233,11 +612,19 @@ def start_api_server(config: ConfigParser, base_dir: str, host: str = '0.0.0.0',
         host: Host to bind to (default 0.0.0.0 for all interfaces)
         port: Port to listen on (default 8080)
     """
-    global _config, _base_dir
-    _config = config
-    _base_dir = base_dir
-
-    server = HTTPServer((host, port), IngestAPIHandler)
+    global _FOLDER_MAP, _STATUS_PATH, _HISTORY_PATH, _LOG_PATH, _OUTPUT_PATH
+
+    # Paths never change while the server runs, so resolve them once up front
+    _FOLDER_MAP = {
+        name: os.path.expanduser(config.get('Paths', name, fallback=None) or '')
+        for name in ('watch', 'processing', 'processed', 'output', 'error')
+    }
+    _STATUS_PATH = os.path.join(base_dir, config['Paths']['status_file'])
+    _HISTORY_PATH = os.path.join(base_dir, config['Paths']['history_file'])
+    _LOG_PATH = os.path.join(base_dir, config['Paths']['logs'], 'ingest_engine.log')
+    _OUTPUT_PATH = _FOLDER_MAP['output']
+
+    server = IngestAPIServer((host, port), IngestAPIHandler)
 
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
@@ -48,6 +48,7 @@ OPTIONS = {
         'watchdog',
         'reportlab',
         'PIL',
+        'orjson',
     ],
     'includes': [
         'main',